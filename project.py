@@ -1,7 +1,306 @@
+import hashlib
+import numpy as np
 import pygame
 import sys
 import time
-from queue import PriorityQueue
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the search kernel then runs as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# Four-connected neighbor offsets as (row, col) deltas
+_OFFSETS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+# Algorithm ids understood by the search kernel
+_ALGORITHMS = {"astar": 0, "dijkstra": 1, "greedy": 2}
+
+_INF = np.iinfo(np.int32).max
+
+
+@njit(cache=True)
+def _bucket_push(bucket_head, bucket_tail, entry_link, entry_node, n_entries, priority, node):
+    """
+    Appends node to the bucket for priority and returns the new entry count.
+    """
+    entry_node[n_entries] = node
+    entry_link[n_entries] = -1
+    if bucket_head[priority] == -1:
+        bucket_head[priority] = n_entries
+    else:
+        entry_link[bucket_tail[priority]] = n_entries
+    bucket_tail[priority] = n_entries
+    return n_entries + 1
+
+
+@njit(cache=True)
+def _bucket_min(bucket_head, cur):
+    """
+    Advances cur to the lowest non-empty bucket; the queue must not be empty.
+    """
+    while bucket_head[cur] == -1:
+        cur += 1
+    return cur
+
+
+@njit(cache=True)
+def _bucket_pop(bucket_head, entry_link, entry_node, cur):
+    """
+    Removes and returns the oldest node in bucket cur, so ties pop in insertion order.
+    """
+    entry = bucket_head[cur]
+    bucket_head[cur] = entry_link[entry]
+    return entry_node[entry]
+
+
+@njit(cache=True)
+def _search(walk_padded, start_r, start_c, end_r, end_c, algo_id):
+    """
+    Runs A* (0), Dijkstra (1) or Greedy Best-First (2) over a walkability mask
+    padded with a one-cell False border, so neighbor lookups need no bounds checks.
+    Returns (path, explored_r, explored_c, n_explored, n_path): path is an
+    (n_path, 2) array of (row, col) cells and explored_r / explored_c hold the
+    expansion order, of which only the first n_explored entries are valid.
+    """
+    rows = walk_padded.shape[0] - 2
+    cols = walk_padded.shape[1] - 2
+    n_cells = rows * cols  # Cells are indexed as row * cols + col
+
+    start = start_r * cols + start_c
+    end = end_r * cols + end_c
+
+    came_from = np.full(n_cells, -1, np.int32)
+    cost_so_far = np.full(n_cells, _INF, np.int32)
+    best_priority = np.full(n_cells, _INF, np.int32)  # Lowest priority enqueued per cell
+    visited = np.zeros(n_cells, np.bool_)
+    explored_r = np.empty(n_cells, np.int16)
+    explored_c = np.empty(n_cells, np.int16)
+    n_explored = 0
+
+    # Dial's bucket queue: priorities are small non-negative ints bounded by the
+    # longest possible path plus the largest heuristic. Each bucket is a FIFO
+    # list threaded through entry_link; every push comes from relaxing one of a
+    # closed cell's four neighbors, which bounds the number of entries.
+    bucket_head = np.full(n_cells + rows + cols, -1, np.int32)
+    bucket_tail = np.empty(n_cells + rows + cols, np.int32)
+    entry_link = np.empty(4 * n_cells + 1, np.int32)
+    entry_node = np.empty(4 * n_cells + 1, np.int32)
+
+    if algo_id == 2:
+        priority = abs(end_r - start_r) + abs(end_c - start_c)
+    else:
+        priority = 0
+    n_entries = _bucket_push(bucket_head, bucket_tail, entry_link, entry_node, 0, priority, start)
+    size = 1
+    cur = priority  # Lowest bucket that may be non-empty
+    cost_so_far[start] = 0
+    best_priority[start] = priority
+
+    while size > 0:
+        cur = _bucket_min(bucket_head, cur)
+        current = _bucket_pop(bucket_head, entry_link, entry_node, cur)
+        size -= 1
+
+        if visited[current]:
+            continue
+        visited[current] = True
+
+        r = current // cols
+        c = current % cols
+        if not walk_padded[r + 1, c + 1]:
+            continue  # Skip wall cells
+        explored_r[n_explored] = r
+        explored_c[n_explored] = c
+        n_explored += 1
+
+        if current == end:
+            break
+
+        for dr, dc in _OFFSETS:
+            nr = r + dr
+            nc = c + dc
+            if not walk_padded[nr + 1, nc + 1]:
+                continue  # Walls and off-grid cells
+            next_pos = nr * cols + nc
+            if visited[next_pos]:
+                continue  # Closed cells are never relaxed
+
+            new_cost = cost_so_far[current] + 1
+            if new_cost >= cost_so_far[next_pos]:
+                continue
+            cost_so_far[next_pos] = new_cost
+            came_from[next_pos] = current
+
+            # Calculate priority based on algorithm
+            if algo_id == 1:
+                priority = new_cost
+            else:
+                h_cost = abs(end_r - nr) + abs(end_c - nc)
+                if algo_id == 0:
+                    priority = new_cost + h_cost
+                else:
+                    priority = h_cost
+
+            # Only enqueue if this beats the entry already in the queue
+            if priority >= best_priority[next_pos]:
+                continue
+            best_priority[next_pos] = priority
+            n_entries = _bucket_push(bucket_head, bucket_tail, entry_link, entry_node, n_entries, priority, next_pos)
+            size += 1
+            if priority < cur:
+                cur = priority  # Greedy priorities are not monotone
+
+    # Reconstruct path; its length is known from the goal's cost, so fill from the tail
+    n_path = 0 if cost_so_far[end] == _INF else cost_so_far[end] + 1
+    path = np.empty((n_path, 2), np.int32)
+    current = end
+    for i in range(n_path - 1, -1, -1):
+        path[i, 0] = current // cols
+        path[i, 1] = current % cols
+        current = came_from[current]
+
+    return path, explored_r, explored_c, n_explored, n_path
+
+
+@njit(cache=True)
+def _search_bidi(walk_padded, start_r, start_c, end_r, end_c, algo_id):
+    """
+    Bidirectional A* (0) or Dijkstra (1): one search grows from the start towards
+    the end and one from the end towards the start, and the path is stitched at the
+    cell where they meet. Takes the same arguments and returns the same tuple as _search.
+
+    A* uses the balanced (average) potential p(v) = (h_end(v) - h_start(v)) / 2 on the
+    forward side and -p(v) on the backward side, so both sides run Dijkstra over the
+    same non-negative reduced edge costs and can stop on the usual bidirectional test.
+    Priorities are doubled (and offset) to stay non-negative integers for the buckets.
+    """
+    rows = walk_padded.shape[0] - 2
+    cols = walk_padded.shape[1] - 2
+    n_cells = rows * cols
+
+    start = start_r * cols + start_c
+    end = end_r * cols + end_c
+
+    # Per-side state: row 0 searches from the start, row 1 from the end
+    came_from = np.full((2, n_cells), -1, np.int32)
+    cost_so_far = np.full((2, n_cells), _INF, np.int32)
+    best_priority = np.full((2, n_cells), _INF, np.int32)
+    visited = np.zeros((2, n_cells), np.bool_)
+    explored_r = np.empty(2 * n_cells, np.int16)
+    explored_c = np.empty(2 * n_cells, np.int16)
+    n_explored = 0
+
+    # Priority is 2 * g + (+/-)(h_end - h_start) + offset; the offset keeps it non-negative
+    offset = rows + cols
+    n_buckets = 2 * (n_cells + rows + cols) + 1
+    bucket_head = np.full((2, n_buckets), -1, np.int32)
+    bucket_tail = np.empty((2, n_buckets), np.int32)
+    entry_link = np.empty((2, 4 * n_cells + 1), np.int32)
+    entry_node = np.empty((2, 4 * n_cells + 1), np.int32)
+    n_entries = np.zeros(2, np.int32)
+    size = np.zeros(2, np.int32)
+    cur = np.zeros(2, np.int32)
+
+    # Both origins sit at potential h_end(start) = h_start(end) on their own side
+    if algo_id == 1:
+        priority = offset
+    else:
+        priority = abs(end_r - start_r) + abs(end_c - start_c) + offset
+    for side, origin in ((0, start), (1, end)):
+        n_entries[side] = _bucket_push(
+            bucket_head[side], bucket_tail[side], entry_link[side], entry_node[side], 0, priority, origin
+        )
+        size[side] = 1
+        cost_so_far[side, origin] = 0
+        best_priority[side, origin] = priority
+
+    # Cost of the best start-to-end path found so far, and the cell where it meets
+    best_cost = 0 if start == end else _INF
+    meet = start if start == end else -1
+
+    while size[0] > 0 and size[1] > 0:
+        cur[0] = _bucket_min(bucket_head[0], cur[0])
+        cur[1] = _bucket_min(bucket_head[1], cur[1])
+
+        # Stop once the two frontiers together can no longer lead to a cheaper path
+        if best_cost != _INF and cur[0] + cur[1] >= 2 * (best_cost + offset):
+            break
+
+        # Expand the side with the smaller frontier
+        side = 0 if size[0] <= size[1] else 1
+        other = 1 - side
+        current = _bucket_pop(bucket_head[side], entry_link[side], entry_node[side], cur[side])
+        size[side] -= 1
+
+        if visited[side, current]:
+            continue
+        visited[side, current] = True
+
+        r = current // cols
+        c = current % cols
+        if not walk_padded[r + 1, c + 1]:
+            continue  # Skip wall cells
+        explored_r[n_explored] = r
+        explored_c[n_explored] = c
+        n_explored += 1
+
+        for dr, dc in _OFFSETS:
+            nr = r + dr
+            nc = c + dc
+            if not walk_padded[nr + 1, nc + 1]:
+                continue  # Walls and off-grid cells
+            next_pos = nr * cols + nc
+            if visited[side, next_pos]:
+                continue  # Closed cells are never relaxed
+
+            new_cost = cost_so_far[side, current] + 1
+            if new_cost >= cost_so_far[side, next_pos]:
+                continue
+            cost_so_far[side, next_pos] = new_cost
+            came_from[side, next_pos] = current
+
+            # A cell reached from both sides joins the two halves into a full path
+            if cost_so_far[other, next_pos] != _INF and new_cost + cost_so_far[other, next_pos] < best_cost:
+                best_cost = new_cost + cost_so_far[other, next_pos]
+                meet = next_pos
+
+            if algo_id == 1:
+                priority = 2 * new_cost + offset
+            else:
+                potential = (abs(end_r - nr) + abs(end_c - nc)) - (abs(start_r - nr) + abs(start_c - nc))
+                if side == 1:
+                    potential = -potential
+                priority = 2 * new_cost + potential + offset
+
+            if priority >= best_priority[side, next_pos]:
+                continue
+            best_priority[side, next_pos] = priority
+            n_entries[side] = _bucket_push(
+                bucket_head[side], bucket_tail[side], entry_link[side], entry_node[side],
+                n_entries[side], priority, next_pos
+            )
+            size[side] += 1
+
+    # Stitch the path: start..meet from the forward side, meet..end from the backward side
+    n_path = 0 if meet == -1 else best_cost + 1
+    path = np.empty((n_path, 2), np.int32)
+    if meet != -1:
+        current = meet
+        for i in range(cost_so_far[0, meet], -1, -1):
+            path[i, 0] = current // cols
+            path[i, 1] = current % cols
+            current = came_from[0, current]
+        current = came_from[1, meet]
+        for i in range(cost_so_far[0, meet] + 1, n_path):
+            path[i, 0] = current // cols
+            path[i, 1] = current % cols
+            current = came_from[1, current]
+
+    return path, explored_r, explored_c, n_explored, n_path
 
 
 class PathfindingVisualizer:
@@ -29,204 +328,183 @@ class PathfindingVisualizer:
         self.width = self.cols * self.cell_size
         self.height = self.rows * self.cell_size
 
-        # Initialize Pygame window and clock
+        # Initialize Pygame window
         pygame.init()
         self.screen = pygame.display.set_mode((self.width, self.height))
         pygame.display.set_caption("Pathfinding Visualizer")
-        self.clock = pygame.time.Clock()
 
         # Grid state: 0 = empty, 1 = wall, 2 = start, 3 = end
-        self.grid = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
+        self.grid = np.zeros((self.rows, self.cols), dtype=np.uint8)
         self.start = (1, 1)
         self.end = (self.rows - 2, self.cols - 2)
 
-        # Animation and search state
-        self.explored_nodes = []
+        # Animation and search state; explored cells are kept as parallel row/col arrays
+        self.explored_rows = np.empty(0, np.int16)
+        self.explored_cols = np.empty(0, np.int16)
         self.path = []
+        self._path_points = []  # Pixel centers of the path cells, for drawing
         self.animation_step = 0
         self.animation_speed = 50  # milliseconds between steps
+        self._dirty = True  # Whether the whole screen needs repainting
 
         self.create_maze()
 
+        # Compile the search kernels now rather than on the first key press
+        self.find_path("astar")
+        self.find_path_bidi("astar")
+
     def create_maze(self):
         """
         Initialize the grid with walls to form a simple maze layout.
         """
-        self.grid = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
+        self.grid = np.zeros((self.rows, self.cols), dtype=np.uint8)
 
         # Horizontal walls
-        for i in range(2, self.cols - 2):
-            self.grid[2][i] = 1
-            self.grid[3][i] = 1
-            self.grid[8][i] = 1
-            self.grid[12][i] = 1
+        self.grid[[2, 3, 8, 12], 2:self.cols - 2] = 1
 
         # Vertical walls
-        for i in range(2, self.rows - 2):
-            self.grid[i][5] = 1
-            self.grid[i][10] = 1
-            self.grid[i][15] = 1
+        self.grid[2:self.rows - 2, [5, 10, 15]] = 1
 
         # Additional obstacles
-        for i in range(3, 7):
-            self.grid[6][i] = 1
-            self.grid[10][i + 8] = 1
+        self.grid[6, 3:7] = 1
+        self.grid[10, 11:15] = 1
 
         # Set start and end points
-        self.grid[self.start[0]][self.start[1]] = 2
-        self.grid[self.end[0]][self.end[1]] = 3
+        self.grid[self.start] = 2
+        self.grid[self.end] = 3
 
-    def get_neighbors(self, row, col):
-        """
-        Returns valid non-wall neighbor cells for a given grid cell.
-        """
-        neighbors = []
-        for dr, dc in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-            new_row, new_col = row + dr, col + dc
-            if (
-                0 <= new_row < self.rows and
-                0 <= new_col < self.cols and
-                self.grid[new_row][new_col] != 1
-            ):
-                neighbors.append((new_row, new_col))
-        return neighbors
+        # Walkability mask, padded with a non-walkable border for bounds-free neighbor tests
+        self.walkable = self.grid != 1
+        self._walk_padded = np.pad(self.walkable, 1, constant_values=False)
 
-    def manhattan_distance(self, a, b):
-        """
-        Returns the Manhattan distance between two points.
-        """
-        return abs(b[0] - a[0]) + abs(b[1] - a[1])
+        # Precompute the rects of the special cells so rendering needs no per-cell branching
+        cs = self.cell_size
+        self._wall_rects = [pygame.Rect(c * cs, r * cs, cs, cs) for r, c in zip(*np.nonzero(self.grid == 1))]
+        self._start_rect = pygame.Rect(self.start[1] * cs, self.start[0] * cs, cs, cs)
+        self._end_rect = pygame.Rect(self.end[1] * cs, self.end[0] * cs, cs, cs)
+
+        self.render_background()
+
+        # Search results are deterministic per maze, so they are memoized until it changes
+        self._maze_key = hashlib.blake2b(self.grid.tobytes(), digest_size=8).digest()
+        self._path_cache = {}
 
     def find_path(self, algorithm):
         """
         Executes the selected pathfinding algorithm and returns the path and explored nodes.
         """
-        start, end = self.start, self.end
-        explored = []
-        frontier = PriorityQueue()
-
-        # Initialize the priority queue based on the algorithm
-        if algorithm == "astar":
-            frontier.put((0, start, 0))  # (priority, node, g_cost)
-        elif algorithm == "dijkstra":
-            frontier.put((0, start, 0))
-        else:  # greedy
-            frontier.put((self.manhattan_distance(start, end), start, 0))
-
-        came_from = {start: None}
-        cost_so_far = {start: 0}
-        visited = set()
-
-        while not frontier.empty():
-            _, current, current_g = frontier.get()
-
-            if current in visited:
-                continue
-            visited.add(current)
-
-            if self.grid[current[0]][current[1]] == 1:
-                continue  # Skip wall cells
-
-            explored.append(current)
-
-            if current == end:
-                break
-
-            for next_pos in self.get_neighbors(*current):
-                if self.grid[next_pos[0]][next_pos[1]] == 1:
-                    continue
-
-                new_cost = cost_so_far[current] + 1
-
-                if next_pos not in cost_so_far or new_cost < cost_so_far[next_pos]:
-                    cost_so_far[next_pos] = new_cost
-                    h_cost = self.manhattan_distance(next_pos, end)
+        return self._unpack_result(_search(
+            self._walk_padded, self.start[0], self.start[1], self.end[0], self.end[1],
+            _ALGORITHMS.get(algorithm, _ALGORITHMS["greedy"])
+        ))
 
-                    # Calculate priority based on algorithm
-                    if algorithm == "astar":
-                        priority = new_cost + h_cost
-                    elif algorithm == "dijkstra":
-                        priority = new_cost
-                    else:
-                        priority = h_cost
-
-                    frontier.put((priority, next_pos, new_cost))
-                    came_from[next_pos] = current
-
-        # Reconstruct path
-        path = []
-        current = end
-        while current is not None:
-            path.append(current)
-            current = came_from.get(current)
-        path.reverse()
-
-        # Ensure path is valid and doesn't cross walls
-        if path and path[0] == start and not any(self.grid[r][c] == 1 for r, c in path):
-            return path, explored
+    def find_path_bidi(self, algorithm):
+        """
+        Runs A* or Dijkstra from both the start and the end at once, meeting in the middle.
+        Greedy search has no bidirectional form and runs as usual.
+        """
+        if algorithm not in ("astar", "dijkstra"):
+            return self.find_path(algorithm)
+        return self._unpack_result(_search_bidi(
+            self._walk_padded, self.start[0], self.start[1], self.end[0], self.end[1],
+            _ALGORITHMS[algorithm]
+        ))
+
+    def _unpack_result(self, result):
+        """
+        Converts a search kernel's buffers into a list of (row, col) path cells
+        and a (rows, cols) pair of arrays holding the explored cells in order.
+        """
+        path_arr, explored_r, explored_c, n_explored, n_path = result
+        explored = (explored_r[:n_explored], explored_c[:n_explored])
+        if n_path == 0:
+            return None, explored
 
-        return None, explored
+        # Walls are never relaxed by the search, so the path cannot cross one
+        assert not (self.grid[path_arr[:, 0], path_arr[:, 1]] == 1).any()
+        return [(int(r), int(c)) for r, c in path_arr], explored
 
     def reset_animation(self):
         """
         Reset the current animation state.
         """
-        self.explored_nodes = []
+        self.explored_rows = np.empty(0, np.int16)
+        self.explored_cols = np.empty(0, np.int16)
         self.path = []
+        self._path_points = []
         self.animation_step = 0
+        self._explored_surface = self._bg.copy()
+
+    def advance_animation(self):
+        """
+        Advance the animation by one step, painting the newly explored cell onto the
+        persistent explored surface. Returns that cell's rect, or None once past the end.
+        """
+        self.animation_step += 1
+        if self.animation_step > len(self.explored_rows):
+            return None
+
+        row = int(self.explored_rows[self.animation_step - 1])
+        col = int(self.explored_cols[self.animation_step - 1])
+        rect = pygame.Rect(col * self.cell_size, row * self.cell_size, self.cell_size, self.cell_size)
 
-    def run_algorithm(self, algorithm):
+        # Avoid overwriting start/end; walls are never explored
+        if (row, col) != self.start and (row, col) != self.end:
+            pygame.draw.rect(self._explored_surface, self.COLORS['lightblue'], rect)
+            pygame.draw.rect(self._explored_surface, self.COLORS['gray'], rect, 1)
+        return rect
+
+    def run_algorithm(self, algorithm, bidirectional=False):
         """
         Trigger the selected algorithm and prepare its animation.
         """
         self.reset_animation()
-        path, explored = self.find_path(algorithm)
+        key = (self._maze_key, self.start, self.end, algorithm, bidirectional)
+        cached = self._path_cache.get(key)
+        if cached is not None:
+            path, explored = cached
+        else:
+            if bidirectional:
+                path, explored = self.find_path_bidi(algorithm)
+            else:
+                path, explored = self.find_path(algorithm)
+            self._path_cache[key] = (path, explored)
         if path:
-            self.explored_nodes = explored
+            self.explored_rows, self.explored_cols = explored
             self.path = path
+            half = self.cell_size // 2
+            self._path_points = [(col * self.cell_size + half, row * self.cell_size + half) for row, col in path]
             self.animation_step = 0
 
-    def draw_grid(self):
+    def render_background(self):
         """
-        Render the entire grid including walls, explored nodes, and path.
+        Render the static maze (cells, walls, start/end and gridlines) onto a cached surface.
         """
-        for i in range(self.rows):
-            for j in range(self.cols):
-                x = j * self.cell_size
-                y = i * self.cell_size
-
-                if self.grid[i][j] == 1:
-                    color = self.COLORS['black']
-                elif self.grid[i][j] == 2:
-                    color = self.COLORS['green']
-                elif self.grid[i][j] == 3:
-                    color = self.COLORS['red']
-                else:
-                    color = self.COLORS['white']
+        self._bg = pygame.Surface((self.width, self.height))
+        self._bg.fill(self.COLORS['white'])
 
-                pygame.draw.rect(self.screen, color, (x, y, self.cell_size, self.cell_size))
-                pygame.draw.rect(self.screen, self.COLORS['gray'], (x, y, self.cell_size, self.cell_size), 1)
+        for rect in self._wall_rects:
+            pygame.draw.rect(self._bg, self.COLORS['black'], rect)
+        pygame.draw.rect(self._bg, self.COLORS['green'], self._start_rect)
+        pygame.draw.rect(self._bg, self.COLORS['red'], self._end_rect)
 
-        # Draw explored nodes (avoid overwriting walls or start/end)
-        for i in range(min(self.animation_step, len(self.explored_nodes))):
-            row, col = self.explored_nodes[i]
-            if (row, col) != self.start and (row, col) != self.end and self.grid[row][col] != 1:
-                x = col * self.cell_size
-                y = row * self.cell_size
-                pygame.draw.rect(self.screen, self.COLORS['lightblue'], (x, y, self.cell_size, self.cell_size))
-                pygame.draw.rect(self.screen, self.COLORS['gray'], (x, y, self.cell_size, self.cell_size), 1)
+        # Gridlines
+        for y in range(0, self.height, self.cell_size):
+            for x in range(0, self.width, self.cell_size):
+                pygame.draw.rect(self._bg, self.COLORS['gray'], (x, y, self.cell_size, self.cell_size), 1)
 
-        # Draw final path after exploration
-        if self.animation_step >= len(self.explored_nodes):
-            for i in range(len(self.path) - 1):
-                start_pos = self.path[i]
-                end_pos = self.path[i + 1]
-                start_x = start_pos[1] * self.cell_size + self.cell_size // 2
-                start_y = start_pos[0] * self.cell_size + self.cell_size // 2
-                end_x = end_pos[1] * self.cell_size + self.cell_size // 2
-                end_y = end_pos[0] * self.cell_size + self.cell_size // 2
+        self._explored_surface = self._bg.copy()
 
-                pygame.draw.line(self.screen, self.COLORS['blue'], (start_x, start_y), (end_x, end_y), 3)
+    def draw_grid(self):
+        """
+        Render the maze with the explored nodes so far, plus the path once exploration is done.
+        """
+        # Explored nodes accumulate on this surface as the animation advances
+        self.screen.blit(self._explored_surface, (0, 0))
+
+        # Draw final path after exploration
+        if self.animation_step >= len(self.explored_rows) and len(self._path_points) >= 2:
+            pygame.draw.lines(self.screen, self.COLORS['blue'], False, self._path_points, 3)
 
     def run(self):
         """
@@ -235,38 +513,68 @@ class PathfindingVisualizer:
         last_update = pygame.time.get_ticks()
 
         while True:
+            animating = self.animation_step < len(self.explored_rows) + 1
+
+            # Sleep until input arrives or the next animation step is due;
+            # with nothing to animate, block on input alone (timeout 0 waits forever)
+            if animating:
+                timeout = max(1, self.animation_speed - (pygame.time.get_ticks() - last_update))
+            else:
+                timeout = 0
+            events = [pygame.event.wait(timeout)] + pygame.event.get()
+
             current_time = pygame.time.get_ticks()
+            dirty_rects = []
 
             # Handle user input
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
 
+                elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                    self._dirty = True  # The window contents were lost and must be repainted
+
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_a:
                         self.run_algorithm("astar")
+                        self._dirty = True
                     elif event.key == pygame.K_d:
                         self.run_algorithm("dijkstra")
+                        self._dirty = True
                     elif event.key == pygame.K_g:
                         self.run_algorithm("greedy")
+                        self._dirty = True
+                    elif event.key == pygame.K_b:
+                        self.run_algorithm("astar", bidirectional=True)
+                        self._dirty = True
                     elif event.key == pygame.K_r:
                         self.create_maze()
                         self.reset_animation()
+                        self._dirty = True
 
             # Advance animation step
             if (
-                current_time - last_update > self.animation_speed and
-                self.animation_step < len(self.explored_nodes) + 1
+                current_time - last_update >= self.animation_speed and
+                self.animation_step < len(self.explored_rows) + 1
             ):
-                self.animation_step += 1
+                rect = self.advance_animation()
                 last_update = current_time
 
-            # Draw everything
-            self.screen.fill(self.COLORS['white'])
-            self.draw_grid()
-            pygame.display.flip()
-            self.clock.tick(60)
+                # Only the newly explored cell changes until the path is revealed
+                if self.animation_step < len(self.explored_rows):
+                    dirty_rects.append(rect)
+                else:
+                    self._dirty = True
+
+            # Draw only when something changed
+            if self._dirty or dirty_rects:
+                self.draw_grid()
+                if self._dirty:
+                    pygame.display.flip()
+                    self._dirty = False
+                else:
+                    pygame.display.update(dirty_rects)
 
 
 # Entry point